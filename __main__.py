@@ -17,20 +17,23 @@ p_start_position = [6, 1]
 # Define the starting positions for the Ghosts as a list of [row, column]
 ghost_start_positions = [[1, 6], [1, 1]]
 
-# Define the game map as a list of lists.
+# Define the game map as a list of rows, one character per tile.
 # Symbols:
 #   '=': A wall (impassable)
 #   '.': A pellet (collectible)
 #   ' ': An empty space
 game_map = [
-    ['=', '=', '=', '=', '=', '=', '=', '=', '=', '=', '=', '='],
-    ['=', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '='],
-    ['=', '.', '=', '=', '=', '=', '.', '.', '=', '.', '.', '='],
-    ['=', '.', '=', '.', '.', '=', '.', '=', '=', '.', '.', '='],
-    ['=', '.', '=', '.', '.', '=', '.', '=', '=', '.', '.', '='],
-    ['=', '.', '=', '.', '.', '=', '.', '.', '=', '.', '.', '='],
-    ['=', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '='],
-    ['=', '=', '=', '=', '=', '=', '=', '=', '=', '=', '=', '=']]
+    "============",
+    "=..........=",
+    "=.====..=..=",
+    "=.=..=.==..=",
+    "=.=..=.==..=",
+    "=.=..=..=..=",
+    "=..........=",
+    "============"]
+
+# Ghost turns per second
+tick_hz = 2
 
 # Create an instance of the game and run it.
-PacmanGame(game_map, p_start_position, ghost_start_positions).run()
+PacmanGame(game_map, p_start_position, ghost_start_positions).run(tick_hz=tick_hz)
@@ -2,17 +2,17 @@
 Pacote MiniProjetoCRP.
 
 Este módulo inicial (package initializer) expõe a API pública do pacote:
-Map, Pacman, Ghost e PacmanGame.
+Map, Pacman, Ghost, PacmanGame e Status.
 
 Uso:
-    from src import Map, Pacman, Ghost, PacmanGame
+    from src import Map, Pacman, Ghost, PacmanGame, Status
 """
 # Exportar classes públicas do pacote
 from .map import Map
 from .pacman import Pacman
 from .ghost import Ghost
-from .pacman_game import PacmanGame
+from .pacman_game import PacmanGame, Status
 
-__all__ = ["Map", "Pacman", "Ghost", "PacmanGame"]
+__all__ = ["Map", "Pacman", "Ghost", "PacmanGame", "Status"]
 __version__ = "0.1.0"
 
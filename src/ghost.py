@@ -5,93 +5,101 @@ This module defines the Ghost class, which encapsulates the logic for
 enemy movement (AI), collision detection, and interaction with map objects.
 """
 
-from random import choice
-from typing import List, Tuple, Optional
+from random import getrandbits, randrange
+from typing import List, Optional, Tuple
 
-ENEMY_BLOCKS = ["😋"]  # The Ghost's target (Pacman)
+from .map import DIRECTIONS, GHOST_CHAR, PACMAN_CHAR
+
+# Lookup tables over 4-bit masks of open directions (bit i = DIRECTIONS[i]):
+# _BIT_COUNT[mask] is the number of open directions and _NTH_BIT[(mask << 2) | k]
+# is the direction index of the k-th open one.
+_BIT_COUNT = tuple(bin(mask).count("1") for mask in range(16))
+_NTH_BIT = tuple(
+    ([i for i in range(4) if mask & (1 << i)] + [-1] * 4)[k]
+    for mask in range(16) for k in range(4)
+)
 
 class Ghost:
     """
     Calculates and applies the ghost's movement per turn.
     """
 
-    def __init__(self, game_map, output_map, ghost_position: List[int]) -> None:
+    def __init__(self, game_map, ghost_position: List[int]) -> None:
         """
-        Initializes the Ghost movement calculator.
+        Initializes the Ghost.
 
         Args:
             game_map: Map instance (provides tile and wall data).
-            output_map: current display map.
-            ghost_position: current Ghost position [row, col].
+            ghost_position: starting Ghost position [row, col].
         """
         self.game_map = game_map
-        self.output_map = output_map
-        self.ghost_position = ghost_position
-        self.lose = False  # Flag to indicate if the move results in a loss
-
-    def __get_ghost_move_possibilities(self) -> List[str]:
+        # Updated in place on every move, so callers may keep a reference to it
+        self.ghost_position = list(ghost_position)
+        # Static wall data shared with the map and every other ghost
+        self._blocked = game_map.blocked
+        self._cols = game_map.cols
+        self.lose = False  # Flag to indicate if the last move resulted in a loss
+
+    def __get_ghost_move_possibilities(self) -> int:
         """
-        Returns a list of valid move directions that are not blocked by walls.
+        Returns a bitmask of open moves: bit i is set when DIRECTIONS[i] is not blocked by a wall.
         """
-        possibilities: List[str] = []
         r, c = self.ghost_position
+        # Ghosts are blocked by walls, but can move through other ghosts
+        return ~self._blocked[r * self._cols + c] & 0xF
 
-        potential_moves = {
-            "up": [r - 1, c],
-            "down": [r + 1, c],
-            "left": [r, c - 1],
-            "right": [r, c + 1]
-        }
-
-        for move, new_pos in potential_moves.items():
-            # Ghosts should not be blocked by walls, but can move through other ghosts
-            is_blocked = self.game_map.is_movement_blocked(self.ghost_position, new_pos)
-            if not is_blocked:
-                possibilities.append(move)
-
-        return possibilities
-
-    def get_move(self) -> Optional[str]:
+    def get_move(self) -> Optional[int]:
         """
         Randomly selects one of the valid move possibilities.
         """
-        return choice(self.__get_ghost_move_possibilities() or [None])
-
-    def get_next_ghost_position(self, move: str) -> Optional[List[int]]:
+        mask = self.__get_ghost_move_possibilities()
+        count = _BIT_COUNT[mask]
+        if not count:
+            return None
+        if count == 4:
+            # Every direction is open: two random bits index DIRECTIONS directly
+            return getrandbits(2)
+        return _NTH_BIT[(mask << 2) | randrange(count)]
+
+    def get_next_ghost_position(self, move: int) -> List[int]:
         """
-        Converts a move string into a target [row, col] position.
+        Converts a direction index into a target [row, col] position.
         """
+        _, dr, dc = DIRECTIONS[move]
         r, c = self.ghost_position
-        moves = {
-            "up": [r - 1, c],
-            "down": [r + 1, c],
-            "left": [r, c - 1],
-            "right": [r, c + 1]
-        }
-        return moves.get(move)
-
-    def move_ghost(self) -> Tuple[List[List[str]], List[int], bool]:
+        return [r + dr, c + dc]
+
+    def move_ghost(self, output_map: List[List[str]]) -> Tuple[List[List[str]], bool]:
         """
         Executes a single tile of movement for the Ghost.
+
+        Args:
+            output_map: current display map, updated in place.
+
+        Returns:
+            The updated display map and whether the Ghost caught Pacman.
         """
+        self.lose = False
         chosen_move = self.get_move()
 
         if chosen_move is None:
-            return self.output_map, self.ghost_position, self.lose
+            return output_map, self.lose
 
         new_pos = self.get_next_ghost_position(chosen_move)
-        if new_pos is None:
-            return self.output_map, self.ghost_position, self.lose
+        r_new, c_new = new_pos
+        new_row = output_map[r_new]
 
         # Check for collision with Pacman
-        if self.output_map[new_pos[0]][new_pos[1]] in ENEMY_BLOCKS:
+        if new_row[c_new] == PACMAN_CHAR:
             self.lose = True
 
         # Restore the base tile character at the ghost's old position
         r_cur, c_cur = self.ghost_position
-        self.output_map[r_cur][c_cur] = self.game_map.get_tile_char(r_cur, c_cur)
+        output_map[r_cur][c_cur] = self.game_map.get_tile_char(r_cur, c_cur)
 
         # Draw the ghost at the new position
-        self.output_map[new_pos[0]][new_pos[1]] = "👻"
+        new_row[c_new] = GHOST_CHAR
+        self.ghost_position[0] = r_new
+        self.ghost_position[1] = c_new
 
-        return self.output_map, new_pos, self.lose
+        return output_map, self.lose
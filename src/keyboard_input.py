@@ -0,0 +1,142 @@
+"""
+Keyboard Input Module
+
+This module reads Pacman's moves straight from the terminal in the game's own
+thread: on POSIX systems stdin is switched to cbreak mode and polled with
+select(), on Windows the console is polled through msvcrt.
+"""
+
+import os
+import sys
+import time
+from typing import Optional, Tuple
+
+from .map import UP, DOWN, LEFT, RIGHT
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import select
+    import termios
+    import tty
+
+# Letter keys mapped to move directions (indices into DIRECTIONS)
+KEY_MOVES = {'w': UP, 'a': LEFT, 's': DOWN, 'd': RIGHT}
+# Final character of the ANSI arrow-key sequences (ESC [ A .. ESC [ D)
+_ANSI_ARROW_MOVES = {'A': UP, 'B': DOWN, 'C': RIGHT, 'D': LEFT}
+# Second character of the Windows console arrow-key codes (prefixed by '\x00' or '\xe0')
+_WINDOWS_ARROW_MOVES = {'H': UP, 'P': DOWN, 'K': LEFT, 'M': RIGHT}
+
+
+def parse_keys(data: str) -> Tuple[Optional[int], str]:
+    """
+    Returns the move for the last move key in a chunk of terminal input, or None,
+    together with an escape sequence left unfinished at the end of the chunk.
+
+    Arrow keys arrive as ANSI escape sequences, possibly with modifier parameters
+    (Ctrl+Up is ESC [ 1 ; 5 A). An unfinished sequence should be put in front of the
+    next chunk. Any other key or escape sequence is ignored.
+    """
+    move = None
+    i, n = 0, len(data)
+    while i < n:
+        char = data[i]
+        if char != '\x1b':
+            move = KEY_MOVES.get(char.lower(), move)
+            i += 1
+            continue
+        if i + 1 == n:
+            return move, data[i:]
+        kind = data[i + 1]
+        if kind == '[':
+            # Skip the parameter and intermediate bytes up to the final byte
+            j = i + 2
+            while j < n and ' ' <= data[j] <= '?':
+                j += 1
+        elif kind == 'O':
+            j = i + 2
+        else:
+            # A lone Esc, or the Alt prefix of a key or of another sequence: drop just
+            # the ESC and read what follows on its own
+            i += 1
+            continue
+        if j == n:
+            return move, data[i:]
+        move = _ANSI_ARROW_MOVES.get(data[j], move)
+        i = j + 1
+    return move, ''
+
+
+class KeyboardInput:
+    """
+    Polls the terminal for move keys.
+
+    Main methods:
+        - start / stop: put the terminal in key-by-key mode and restore it.
+        - poll_move: wait a bounded time for the next move key.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the reader; the terminal is left untouched until start()."""
+        self._saved_attrs = None
+        self._pending = ''  # Start of an escape sequence split across reads
+
+    def start(self) -> None:
+        """Switches stdin to cbreak mode so key presses arrive without Enter or echo."""
+        if os.name == 'nt' or not sys.stdin.isatty():
+            return
+        fd = sys.stdin.fileno()
+        self._saved_attrs = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+
+    def stop(self) -> None:
+        """Restores the terminal settings saved by start()."""
+        self._pending = ''
+        if self._saved_attrs is not None:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved_attrs)
+            self._saved_attrs = None
+
+    def poll_move(self, timeout: float) -> Optional[int]:
+        """
+        Waits up to timeout seconds for a move key.
+
+        Returns:
+            The move direction as an index into DIRECTIONS, or None if no move key
+            was pressed in time. When several keys are waiting, the latest wins.
+        """
+        deadline = time.monotonic() + timeout
+        if os.name == 'nt':
+            return self.__poll_windows(deadline)
+        return self.__poll_posix(deadline)
+
+    def __poll_posix(self, deadline: float) -> Optional[int]:
+        """Waits on stdin with select() until a move key arrives or the deadline passes."""
+        fd = sys.stdin.fileno()
+        while True:
+            ready, _, _ = select.select([fd], [], [], max(0.0, deadline - time.monotonic()))
+            if not ready:
+                return None
+            data = os.read(fd, 32)
+            if not data:
+                # End of input: nothing more will arrive, so just wait out the deadline
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                return None
+            move, self._pending = parse_keys(self._pending + data.decode(errors='ignore'))
+            if move is not None:
+                return move
+            if time.monotonic() >= deadline:
+                return None
+
+    def __poll_windows(self, deadline: float) -> Optional[int]:
+        """Polls the console with msvcrt until a move key arrives or the deadline passes."""
+        while True:
+            move = None
+            while msvcrt.kbhit():
+                char = msvcrt.getwch()
+                if char in ('\x00', '\xe0'):
+                    move = _WINDOWS_ARROW_MOVES.get(msvcrt.getwch(), move)
+                else:
+                    move = KEY_MOVES.get(char.lower(), move)
+            if move is not None or time.monotonic() >= deadline:
+                return move
+            time.sleep(0.01)
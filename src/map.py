@@ -1,4 +1,16 @@
-from typing import List
+from typing import List, Sequence, Tuple
+
+# Cardinal directions as (name, row delta, column delta). Movement code works
+# with indices into this tuple; the names are only needed at the edges.
+DIRECTIONS = (("up", -1, 0), ("down", 1, 0), ("left", 0, -1), ("right", 0, 1))
+UP, DOWN, LEFT, RIGHT = range(len(DIRECTIONS))
+
+# Bit in Map.blocked for each (row delta, column delta) of an adjacent move
+_DELTA_BIT = {(dr, dc): 1 << i for i, (_, dr, dc) in enumerate(DIRECTIONS)}
+
+# Sprite characters drawn over the base tiles on the display map
+PACMAN_CHAR = '😋'
+GHOST_CHAR = '👻'
 
 class Tile:
     """
@@ -10,6 +22,9 @@ class Tile:
         wall_north, wall_south, wall_east, wall_west (bool): Wall presence on each border.
         display_char (str): The character to use for rendering this tile.
     """
+    __slots__ = ('has_pellet', 'is_original_wall', 'wall_north', 'wall_south',
+                 'wall_east', 'wall_west', 'display_char')
+
     def __init__(self, character: str):
         self.has_pellet = (character == '.')
         self.is_original_wall = (character == '=')
@@ -28,51 +43,60 @@ class Map:
     Represents the game map using a grid of Tile objects with border walls.
     """
 
-    def __init__(self, tiles_str: List[List[str]]) -> None:
+    def __init__(self, tiles_str: Sequence[Sequence[str]]) -> None:
         """
         Initializes the Map, setting up tiles and border walls from a character matrix.
+
+        Each row may be a list of characters or a plain string.
         """
         self.tiles: List[List[Tile]] = [[Tile(char) for char in row] for row in tiles_str]
         self.rows = len(self.tiles)
         self.cols = len(self.tiles[0]) if self.rows > 0 else 0
-        self._initialize_borders()
-        self._set_display_chars()
+        self.pellets_remaining = sum(tile.has_pellet for row in self.tiles for tile in row)
+        self._initialize_tiles()
 
-    def _initialize_borders(self):
-        """
-        Sets wall flags on tile borders by checking for transitions between wall and non-wall tiles
-        in the original map layout.
-        """
-        for r in range(self.rows):
-            for c in range(self.cols):
-                # Check for a wall to the south
-                if r < self.rows - 1:
-                    if self.tiles[r][c].is_original_wall != self.tiles[r + 1][c].is_original_wall:
-                        self.tiles[r][c].wall_south = True
-                        self.tiles[r + 1][c].wall_north = True
-                # Check for a wall to the east
-                if c < self.cols - 1:
-                    if self.tiles[r][c].is_original_wall != self.tiles[r][c + 1].is_original_wall:
-                        self.tiles[r][c].wall_east = True
-                        self.tiles[r][c + 1].wall_west = True
-
-    def _set_display_chars(self):
+    def _initialize_tiles(self):
         """
-        Sets the character for displaying each tile, including oriented walls.
+        Derives everything that depends on the original wall layout in a single pass:
+        border walls on each tile (set between wall and non-wall neighbours), the flat
+        blocked-direction mask and the display character, including oriented walls.
         """
-        for r in range(self.rows):
-            for c in range(self.cols):
-                tile = self.tiles[r][c]
-                if tile.is_original_wall:
+        # Flat copy of the original wall layout, indexed by r * cols + c
+        walls = bytes(tile.is_original_wall for row in self.tiles for tile in row)
+        rows, cols = self.rows, self.cols
+        # Bit i of a cell is set when moving in DIRECTIONS[i] is blocked, either by a wall
+        # or by the edge of the map.
+        blocked = bytearray(rows * cols)
+        for r in range(rows):
+            row = self.tiles[r]
+            for c in range(cols):
+                tile = row[c]
+                i = r * cols + c
+                wall = walls[i]
+
+                # Neighbouring wall flags; off-map neighbours count as missing
+                up = walls[i - cols] if r > 0 else None
+                down = walls[i + cols] if r < rows - 1 else None
+                left = walls[i - 1] if c > 0 else None
+                right = walls[i + 1] if c < cols - 1 else None
+
+                tile.wall_north = up is not None and up != wall
+                tile.wall_south = down is not None and down != wall
+                tile.wall_west = left is not None and left != wall
+                tile.wall_east = right is not None and right != wall
+
+                mask = 0
+                if up is None or tile.wall_north: mask |= 1
+                if down is None or tile.wall_south: mask |= 2
+                if left is None or tile.wall_west: mask |= 4
+                if right is None or tile.wall_east: mask |= 8
+                blocked[i] = mask
+
+                if wall:
                     # Display oriented walls for original wall tiles
-                    has_neighbor_up = r > 0 and self.tiles[r - 1][c].is_original_wall
-                    has_neighbor_down = r < self.rows - 1 and self.tiles[r + 1][c].is_original_wall
-                    has_neighbor_left = c > 0 and self.tiles[r][c - 1].is_original_wall
-                    has_neighbor_right = c < self.cols - 1 and self.tiles[r][c + 1].is_original_wall
- 
-                    is_vertical = has_neighbor_up or has_neighbor_down
-                    is_horizontal = has_neighbor_left or has_neighbor_right
- 
+                    is_vertical = bool(up or down)
+                    is_horizontal = bool(left or right)
+
                     if is_vertical and not is_horizontal:
                         tile.display_char = '|'
                     elif is_horizontal and not is_vertical:
@@ -84,6 +108,16 @@ class Map:
                 else:
                     tile.display_char = ' '
 
+        # Walls never change during a game, so the mask is frozen and shared by all readers
+        self.blocked = bytes(blocked)
+        # Rendered base layer; only pellet removal changes it afterwards
+        self._display_template = [[tile.display_char for tile in row] for row in self.tiles]
+        # Display map handed out by get_display_map, and the sprite cells drawn on it
+        self._display_map = [row[:] for row in self._display_template]
+        self._overlay_cells: List[Tuple[int, int]] = []
+        # Rows of the display map that changed since a renderer last cleared this set
+        self.dirty_rows = set(range(rows))
+
     def in_bounds(self, pos: List[int]) -> bool:
         """Returns True if the position is within the map boundaries."""
         r, c = pos
@@ -91,49 +125,61 @@ class Map:
 
     def is_movement_blocked(self, from_pos: List[int], to_pos: List[int]) -> bool:
         """Checks if movement between two adjacent tiles is blocked by a wall or map bounds."""
-        if not self.in_bounds(to_pos):
-            return True  # Movement out of bounds is always blocked
-
         r_from, c_from = from_pos
-        r_to, c_to = to_pos
-        tile_from = self.tiles[r_from][c_from]
+        bit = _DELTA_BIT.get((to_pos[0] - r_from, to_pos[1] - c_from))
+        if bit is None:
+            return True  # Non-adjacent movement is not allowed
 
-        if r_to == r_from - 1: return tile_from.wall_north
-        if r_to == r_from + 1: return tile_from.wall_south
-        if c_to == c_from - 1: return tile_from.wall_west
-        if c_to == c_from + 1: return tile_from.wall_east
-
-        return True  # Non-adjacent movement is not allowed
+        return bool(self.blocked[r_from * self.cols + c_from] & bit)
 
     def get_tile_char(self, row: int, col: int) -> str:
         """Returns the display character of the tile at the given position."""
-        return self.tiles[row][col].display_char
+        return self._display_template[row][col]
 
     def remove_pellet(self, pos: List[int]) -> None:
         """Removes a pellet from the given position."""
-        if self.in_bounds(pos):
-            r, c = pos
+        r, c = pos
+        if 0 <= r < self.rows and 0 <= c < self.cols:
             tile = self.tiles[r][c]
             if tile.has_pellet:
                 tile.has_pellet = False
+                self.pellets_remaining -= 1
                 if not tile.is_original_wall:
                     tile.display_char = ' '
+                    self._display_template[r][c] = ' '
+                    self.dirty_rows.add(r)
 
     def copy_tiles_as_str(self) -> List[List[str]]:
         """Returns a copy of the map's display characters."""
-        return [[str(tile) for tile in row] for row in self.tiles]
+        return [row[:] for row in self._display_template]
 
     def get_display_map(self, pacman_pos: List[int], ghosts_positions: List[List[int]]) -> List[List[str]]:
         """
-        Returns a copy of the map as characters with Pac-Man and the Ghost overlaid.
+        Returns the map as characters with Pac-Man and the Ghosts overlaid.
+
+        The same list is returned on every call and updated in place: the cells that held
+        sprites last time are restored from the base layer before the new sprites are drawn.
+        The rows of both the old and the new sprite cells are added to dirty_rows.
         """
-        out = self.copy_tiles_as_str()
-        if self.in_bounds(pacman_pos):
-            r, c = pacman_pos
-            out[r][c] = '😋' 
+        out = self._display_map
+        template = self._display_template
+        dirty_rows = self.dirty_rows
+        for r, c in self._overlay_cells:
+            out[r][c] = template[r][c]
+            dirty_rows.add(r)
+
+        overlay = []
+        rows, cols = self.rows, self.cols
+        r, c = pacman_pos
+        if 0 <= r < rows and 0 <= c < cols:
+            out[r][c] = PACMAN_CHAR
+            overlay.append((r, c))
+            dirty_rows.add(r)
         # Place all ghosts on the map
-        for ghost_pos in ghosts_positions:
-            if self.in_bounds(ghost_pos):
-                r, c = ghost_pos
-                out[r][c] = '👻'
+        for r, c in ghosts_positions:
+            if 0 <= r < rows and 0 <= c < cols:
+                out[r][c] = GHOST_CHAR
+                overlay.append((r, c))
+                dirty_rows.add(r)
+        self._overlay_cells = overlay
         return out
@@ -7,96 +7,98 @@ This module defines the Pacman class, responsible for:
 - updating the display map (output_map).
 """
 
-from typing import List, Tuple, Optional
+from typing import List, Tuple
 
-# Define tile types
-ENEMY_BLOCKS = ["👻"]  # Tiles that cause Pacman to lose (ghosts)
+from .map import DIRECTIONS, GHOST_CHAR, PACMAN_CHAR
 
 class Pacman:
     """
     Calculates and applies Pacman's movement per turn.
 
     Main methods:
+        - can_move: checks whether a wall blocks a direction.
         - _validate_move: checks if the intended move is allowed.
         - move_pacman: applies the move and updates maps/state.
     """
 
-    def __init__(self, game_map, output_map, pacman_position: List[int], move: str) -> None:
+    def __init__(self, game_map, pacman_position: List[int]) -> None:
         """
-        Initializes the Pacman movement calculator.
+        Initializes Pacman.
 
         Args:
             game_map: Map instance (provides base tiles and utilities).
-            output_map: current display map (with 'P' and 'F').
-            pacman_position: current Pacman position [row, col].
-            move: desired direction ("up", "down", "left", "right").
+            pacman_position: starting Pacman position [row, col].
         """
         self.game_map = game_map
-        self.output_map = output_map
-        self.pacman_position = pacman_position
-        self.move = move
-        self.lose = False  # Flag to indicate if the move results in a loss
-
-    @property
-    def next_pacman_position_location(self) -> Optional[List[int]]:
+        # Updated in place on every move, so callers may keep a reference to it
+        self.pacman_position = list(pacman_position)
+        # Static wall data shared with the map and the ghosts
+        self._blocked = game_map.blocked
+        self._cols = game_map.cols
+        self.lose = False  # Flag to indicate if the last move resulted in a loss
+
+    def can_move(self, move: int) -> bool:
         """
-        Calculates the target position based on the stored move direction.
-
-        Returns:
-            [row, col] of the target position or None if the direction is invalid.
+        Returns True if neither a wall nor the map edge blocks DIRECTIONS[move].
         """
         r, c = self.pacman_position
-        moves = {
-            "up": [r - 1, c],
-            "down": [r + 1, c],
-            "left": [r, c - 1],
-            "right": [r, c + 1]
-        }
-        return moves.get(self.move)
-
-    def _validate_move(self) -> bool:
+        return not self._blocked[r * self._cols + c] >> move & 1
+
+    def get_next_pacman_position(self, move: int) -> List[int]:
         """
-        Validates the intended move by checking for walls and enemies.
+        Converts a direction index into a target [row, col] position.
         """
-        new_pos = self.next_pacman_position_location
-        if new_pos is None:
-            return False
+        _, dr, dc = DIRECTIONS[move]
+        r, c = self.pacman_position
+        return [r + dr, c + dc]
 
-        # Check for walls using the border-based method
-        if self.game_map.is_movement_blocked(self.pacman_position, new_pos):
+    def _validate_move(self, output_map: List[List[str]], move: int, new_pos: List[int]) -> bool:
+        """
+        Validates the intended move to new_pos by checking for walls and enemies.
+        """
+        # Check for walls using the precomputed blocked-direction mask
+        if not self.can_move(move):
             return False
 
         # Check for enemies on the display map
-        if self.output_map[new_pos[0]][new_pos[1]] in ENEMY_BLOCKS:
+        if output_map[new_pos[0]][new_pos[1]] == GHOST_CHAR:
             self.lose = True
             # This is a valid move, but it results in a loss
             return True
 
         return True
 
-    def move_pacman(self) -> Tuple[object, List[List[str]], List[int], bool]:
+    def move_pacman(self, output_map: List[List[str]], move: int) -> Tuple[List[List[str]], bool]:
         """
         Executes a single tile of movement for Pacman.
-        """
-        if not self._validate_move():
-            return self.game_map, self.output_map, self.pacman_position, self.lose
 
-        new_pos = self.next_pacman_position_location
-        if new_pos is None:
-            return self.game_map, self.output_map, self.pacman_position, self.lose
+        Args:
+            output_map: current display map, updated in place.
+            move: desired direction, as an index into DIRECTIONS.
+
+        Returns:
+            The updated display map and whether Pacman ran into a Ghost.
+        """
+        self.lose = False
+        new_pos = self.get_next_pacman_position(move)
+        if not self._validate_move(output_map, move, new_pos):
+            return output_map, self.lose
 
-        # If the move results in a loss, update state and return
+        # If the move results in a loss, Pacman stays where he is
         if self.lose:
-            return self.game_map, self.output_map, self.pacman_position, self.lose
+            return output_map, self.lose
 
         # Update output_map: restore base tile at the old location
         r_old, c_old = self.pacman_position
-        self.output_map[r_old][c_old] = " "
+        output_map[r_old][c_old] = self.game_map.get_tile_char(r_old, c_old)
 
         # Place Pacman on the new tile
-        self.output_map[new_pos[0]][new_pos[1]] = "😋"
+        r_new, c_new = new_pos
+        output_map[r_new][c_new] = PACMAN_CHAR
 
         # Remove pellet from the game map at the new position
         self.game_map.remove_pellet(new_pos)
+        self.pacman_position[0] = r_new
+        self.pacman_position[1] = c_new
 
-        return self.game_map, self.output_map, new_pos, self.lose
+        return output_map, self.lose
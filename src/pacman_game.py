@@ -7,12 +7,38 @@ player input, state updates, and rendering to the terminal.
 
 from .pacman import Pacman
 from .ghost import Ghost
-from .map import Map
+from .map import Map, GHOST_CHAR, PACMAN_CHAR
+from .keyboard_input import KeyboardInput
+from enum import Enum, auto
 import os
-from pynput import keyboard
-from typing import List
+import shutil
+import sys
+from typing import List, Optional
 import time
-import queue
+
+# ANSI escape sequence: move the cursor home and clear the screen
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+def _enable_ansi_escapes() -> None:
+    """Turns on ANSI escape processing in the Windows console (Windows 10+)."""
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    except (AttributeError, OSError):
+        pass
+
+class Status(Enum):
+    """Outcome of a game update."""
+    CONTINUE = auto()
+    WIN = auto()
+    LOSE = auto()
 
 class PacmanGame:
     """
@@ -28,125 +54,163 @@ class PacmanGame:
         else:
             self.game_map = Map(game_map)
 
-        self.pacman_position = pacman_position
+        self.pacman = Pacman(self.game_map, pacman_position)
         self.ghosts = [Ghost(self.game_map, pos) for pos in ghosts_positions]
+        # The ghosts' own position lists, which they update in place as they move
+        self.ghost_positions = [ghost.ghost_position for ghost in self.ghosts]
         self.score = 0
         self.output_map = None
-        self.turn = "ghost"
-        self.move_queue = queue.Queue(maxsize=1)
-        self.possible_moves = []
-        self.listener = keyboard.Listener(on_press=self.on_press, daemon=True)
-        self.listener.start()
-
-    def on_press(self, key):
-        """Callback function for pynput listener. Puts valid moves into a queue."""
-        move = None
-        try:
-            char_key = key.char
-            if char_key in ['w', 'a', 's', 'd']:
-                move = {'w': 'up', 'a': 'left', 's': 'down', 'd': 'right'}[char_key]
-        except AttributeError:
-            if key == keyboard.Key.up:
-                move = 'up'
-            elif key == keyboard.Key.down:
-                move = 'down'
-            elif key == keyboard.Key.left:
-                move = 'left'
-            elif key == keyboard.Key.right:
-                move = 'right'
-        
-        if move and move in self.possible_moves and self.turn == 'pacman':
-            try:
-                self.move_queue.put_nowait(move)
-            except queue.Full:
-                pass
-
-    def __get_possible_moves(self) -> List[str]:
-        """Returns a list of valid move directions for Pac-Man."""
-        moves = []
-        r, c = self.pacman_position
-        if not self.game_map.is_movement_blocked(self.pacman_position, [r - 1, c]):
-            moves.append('up')
-        if not self.game_map.is_movement_blocked(self.pacman_position, [r + 1, c]):
-            moves.append('down')
-        if not self.game_map.is_movement_blocked(self.pacman_position, [r, c - 1]):
-            moves.append('left')
-        if not self.game_map.is_movement_blocked(self.pacman_position, [r, c + 1]):
-            moves.append('right')
-        return moves
+        self._prev_lines = None  # Lines of the last frame drawn, for partial redraws
+        self._row_lines = None  # Formatted map rows, rebuilt only when the map marks them dirty
+        self._terminal_size = None
+        self._dirty = True  # Set whenever the game state changes and the frame is stale
+        self.keyboard = KeyboardInput()
+        _enable_ansi_escapes()
+
+    @property
+    def pacman_position(self) -> List[int]:
+        """Pacman's current [row, col] position, as tracked by Pacman himself."""
+        return self.pacman.pacman_position
 
     def print_game(self) -> None:
         """Prints the game state to the terminal."""
-        # Print a newline to ensure the cursor is at the start of a line before clearing.
-        print()
-        os.system('cls' if os.name == 'nt' else 'clear') 
-        ghost_positions = [ghost.ghost_position for ghost in self.ghosts]
-        self.output_map = self.game_map.get_display_map(self.pacman_position, ghost_positions)
-        if not self.output_map:
-            print("(Map not initialized)\n")
+        output_map = self.game_map.get_display_map(self.pacman_position, self.ghost_positions)
+        self.output_map = output_map
+
+        if not output_map:
+            self._prev_lines = None  # Force a full redraw once the map is back
+            self._row_lines = None
+            sys.stdout.write(CLEAR_SCREEN + "(Map not initialized)\n\n")
+            sys.stdout.flush()
             return
-        
-        for row in self.output_map:
-            line = []
-            for char in row:
-                line.append(char)
-                # Emojis are wide characters; don't add a space after them.
-                if char not in ['😋', '👻']:
-                    line.append(' ')
-            print("".join(line).rstrip())
-        print(f"\nScore: {self.score}\n")
-        if self.turn == 'pacman':
-            self.possible_moves = self.__get_possible_moves()
-        print(f"Turn: {self.turn.capitalize()}'s Turn")
+
+        row_lines = self._row_lines
+        dirty_rows = self.game_map.dirty_rows
+        if row_lines is None or len(row_lines) != len(output_map):
+            row_lines = self._row_lines = [''] * len(output_map)
+            dirty_rows = range(len(output_map))
+        for r in dirty_rows:
+            line = ' '.join(output_map[r])
+            # Emojis are wide characters; don't add a space after them.
+            if PACMAN_CHAR in line:
+                line = line.replace(PACMAN_CHAR + ' ', PACMAN_CHAR)
+            if GHOST_CHAR in line:
+                line = line.replace(GHOST_CHAR + ' ', GHOST_CHAR)
+            row_lines[r] = line.rstrip()
+        self.game_map.dirty_rows.clear()
+
+        lines = row_lines[:]
+        lines.append("")
+        lines.append(f"Score: {self.score}")
+        self.__draw(lines)
+
+    def __draw(self, lines: List[str]) -> None:
+        """
+        Writes a frame to the terminal in a single call, redrawing only the lines that
+        changed since the previous frame. The first frame, and any frame after the
+        terminal was resized, is drawn in full.
+        """
+        prev = self._prev_lines
+        size = shutil.get_terminal_size()
+        if prev is None or size != self._terminal_size:
+            out = [CLEAR_SCREEN, "\n".join(lines), "\n"]
+        else:
+            out = []
+            for i, line in enumerate(lines):
+                if i >= len(prev) or line != prev[i]:
+                    # Move to the start of the line, write it and erase what's left of the old one
+                    out.append(f"\x1b[{i + 1};1H{line}\x1b[K")
+            if len(lines) < len(prev):
+                out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+            # Leave the cursor below the frame, where a full redraw would have left it
+            out.append(f"\x1b[{len(lines) + 1};1H")
+        self._prev_lines = lines
+        self._terminal_size = size
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
     def __check_victory(self) -> bool:
         """Checks if all pellets have been collected."""
-        for row in self.game_map.tiles:
-            for tile in row:
-                if tile.has_pellet:
-                    return False
-        return True
+        return self.game_map.pellets_remaining == 0
+
+    def move_ghosts(self) -> bool:
+        """
+        Moves every ghost one tile on the current display map.
+
+        Returns:
+            True as soon as a ghost catches Pacman; the remaining ghosts don't move.
+        """
+        output_map = self.output_map
+        lose = False
+        for ghost in self.ghosts:
+            output_map, lose = ghost.move_ghost(output_map)
+            if lose:
+                break
+        self.output_map = output_map
+        return lose
 
-    def run(self) -> None:
+    def step(self, move: Optional[int] = None, ghosts_due: bool = True) -> Status:
+        """
+        Advances the game by one update: Pacman takes the move, if there is one and it
+        isn't blocked, then the ghosts move if they are due and the game isn't over yet.
+
+        Args:
+            move: Pacman's direction as an index into DIRECTIONS, or None.
+            ghosts_due: whether the ghosts move in this update.
+
+        Returns:
+            Status.WIN or Status.LOSE once the game is over, otherwise Status.CONTINUE.
+        """
+        if self.output_map is None:
+            self.output_map = self.game_map.get_display_map(self.pacman_position, self.ghost_positions)
+
+        if move is not None and self.pacman.can_move(move):
+            self.output_map, lose = self.pacman.move_pacman(self.output_map, move)
+            self._dirty = True
+            if lose:
+                return Status.LOSE
+
+        if self.__check_victory():
+            return Status.WIN
+        if ghosts_due:
+            self._dirty = True
+            if self.move_ghosts():
+                return Status.LOSE
+        return Status.CONTINUE
+
+    def run(self, tick_hz: float = 2.0) -> None:
         """
         Runs the main game loop.
+
+        Pacman moves as soon as a move key is pressed, while the ghosts move on a
+        fixed clock. A frame is only drawn when something changed.
+
+        Args:
+            tick_hz: ghost moves per second.
         """
+        tick = 1.0 / tick_hz
+        next_ghost_tick = time.monotonic() + tick
+        status = Status.WIN if self.__check_victory() else Status.CONTINUE
+        self._dirty = True
+        self.keyboard.start()
         try:
             while True:
-                self.print_game()
-
-                if self.__check_victory():
-                    print("CONGRATULATIONS, YOU WON!")
+                # Render at most once per iteration, whatever changed since the last frame
+                if self._dirty:
+                    self.print_game()
+                    self._dirty = False
+                if status is not Status.CONTINUE:
                     break
 
-                if self.turn == "ghost":
-                    time.sleep(0.5)
-                    for ghost in self.ghosts:
-                        self.output_map, lose = ghost.move_ghost(self.output_map)
-                        if lose:
-                            self.print_game()
-                            print("YOU LOST")
-                            # Use a return to exit the run method immediately
-                            return
-                    self.turn = "pacman"
-
-                elif self.turn == "pacman":
-                    try:
-                        move = self.move_queue.get(timeout=60)
-                        self.move_queue.task_done()
-                    except queue.Empty:
-                        continue
-
-                    game_map_obj, output_map, pacman_position, lose = Pacman(
-                        self.game_map, self.output_map, self.pacman_position, move
-                    ).move_pacman()
-                    self.game_map, self.output_map, self.pacman_position = game_map_obj, output_map, pacman_position
-                    
-                    if lose:
-                        self.print_game()
-                        print("YOU LOST")
-                        break
-                    self.turn = "ghost"
+                # Wait for input, but no longer than until the ghosts are due
+                move = self.keyboard.poll_move(timeout=max(0.0, next_ghost_tick - time.monotonic()))
+                now = time.monotonic()
+                ghosts_due = now >= next_ghost_tick
+                if ghosts_due:
+                    # Stay on the fixed clock, but don't burst to catch up after a stall
+                    next_ghost_tick = max(next_ghost_tick + tick, now)
+                status = self.step(move, ghosts_due)
 
+            print("CONGRATULATIONS, YOU WON!" if status is Status.WIN else "YOU LOST")
         finally:
-            self.listener.stop()
+            self.keyboard.stop()
@@ -8,48 +8,81 @@ This file specifically tests the ghost's movement logic:
 """
 
 from src.ghost import Ghost
-from copy import deepcopy
+from src.map import Map, UP, DOWN, LEFT, RIGHT
 
 
 def test_ghost_finds_valid_moves():
     """Tests the ghost's ability to see open vs. blocked paths."""
-    test_map = [
+    test_map = Map([
+        ['=', '=', '=', '=', '='],
+        ['=', '=', ' ', '=', '='],
+        ['=', ' ', ' ', ' ', '='],  # Ghost at [2, 2]
         ['=', '=', '=', '=', '='],
-        ['=', ' ', '=', ' ', '='],
-        ['=', ' ', 'F', ' ', '='],  # Ghost at [2, 2]
-        ['=', ' ', '=', ' ', '='],
         ['=', '=', '=', '=', '=']
-    ]
+    ])
     # In this map, the ghost has 3 valid moves: up, left, right. 'down' is a wall.
 
-    g = Ghost(test_map, test_map, ghost_position=[2, 2])
+    g = Ghost(test_map, ghost_position=[2, 2])
 
     # We test the "private" method __get_ghost_move_possibilities
-    # Note: Pacman ('P') is also a valid move tile for a ghost.
-
     possibilities = g._Ghost__get_ghost_move_possibilities()
 
-    assert "up" in possibilities
-    assert "left" in possibilities
-    assert "right" in possibilities
-    assert "down" not in possibilities  # Blocked by wall at [3, 2]
-    assert len(possibilities) == 3
+    assert possibilities & (1 << UP)
+    assert possibilities & (1 << LEFT)
+    assert possibilities & (1 << RIGHT)
+    assert not possibilities & (1 << DOWN)  # Blocked by wall at [3, 2]
+    assert bin(possibilities).count("1") == 3
 
 
 def test_ghost_is_corralled():
     """Tests that the ghost finds no valid moves when walled in."""
-    test_map = [
+    test_map = Map([
         ['=', '=', '='],
-        ['=', 'F', '='],
+        ['=', ' ', '='],
         ['=', '=', '=']
-    ]
-    g = Ghost(test_map, test_map, ghost_position=[1, 1])
+    ])
+    g = Ghost(test_map, ghost_position=[1, 1])
     possibilities = g._Ghost__get_ghost_move_possibilities()
 
-    # A ghost with no moves will cause an error with random.choice
-    # This test confirms it finds no moves.
-    # A more robust 'get_move' would handle an empty list.
-    assert len(possibilities) == 0
+    assert possibilities == 0
+    assert g.get_move() is None
+
+    # A corralled ghost stays where it is
+    output_map = test_map.get_display_map([0, 0], [[1, 1]])
+    _, lose = g.move_ghost(output_map)
+    assert lose is False
+    assert g.ghost_position == [1, 1]
+
+
+def test_ghost_only_picks_open_moves():
+    """Tests that random move selection never picks a blocked direction."""
+    test_map = Map([
+        ['=', '=', '=', '=', '='],
+        ['=', '=', ' ', '=', '='],
+        ['=', ' ', ' ', '=', '='],  # Ghost at [2, 2]; only up and left are open
+        ['=', '=', '=', '=', '='],
+    ])
+    g = Ghost(test_map, ghost_position=[2, 2])
+
+    moves = {g.get_move() for _ in range(100)}
+
+    assert moves == {UP, LEFT}
+
+
+def test_ghost_at_crossroads_picks_every_direction():
+    """Tests that a ghost with all four directions open can take any of them."""
+    test_map = Map([
+        ['=', '=', '=', '=', '='],
+        ['=', '=', ' ', '=', '='],
+        ['=', ' ', ' ', ' ', '='],  # Ghost at [2, 2]
+        ['=', '=', ' ', '=', '='],
+        ['=', '=', '=', '=', '='],
+    ])
+    g = Ghost(test_map, ghost_position=[2, 2])
+
+    moves = {g.get_move() for _ in range(200)}
+
+    assert moves == {UP, DOWN, LEFT, RIGHT}
 
 
 def test_ghost_hits_pacman():
@@ -57,52 +90,61 @@ def test_ghost_hits_pacman():
 
     # Create a map where the ONLY valid move for the ghost is onto Pacman.
     # This avoids randomness and forces the desired outcome.
-    test_map = [
+    test_map = Map([
         ['=', '=', '='],
-        ['=', 'P', '='],  # Pacman at [1, 1]
-        ['=', 'F', '='],  # Ghost at [2, 1]
+        ['=', ' ', '='],  # Pacman at [1, 1]
+        ['=', ' ', '='],  # Ghost at [2, 1]
         ['=', '=', '=']
-    ]
-    # Base map for restoring the tile
-    base_map = deepcopy(test_map)
-    base_map[1][1] = " "  # Pacman's tile is just an empty space on base map
-    base_map[2][1] = " "  # Ghost's tile is just an empty space on base map
-
-    ghost_pos = [2, 1]
+    ])
+    output_map = test_map.get_display_map([1, 1], [[2, 1]])
 
     # The only valid move for the Ghost is 'up'
-    g = Ghost(base_map, test_map, ghost_pos)
-    new_output_map, new_ghost_pos, lose = g.move_ghost()
+    g = Ghost(test_map, [2, 1])
+    new_output_map, lose = g.move_ghost(output_map)
 
     assert lose is True
-    assert new_ghost_pos == [1, 1]
+    assert g.ghost_position == [1, 1]
     assert new_output_map[2][1] == " "  # Ghost's old spot is restored
-    assert new_output_map[1][1] == "F"  # Ghost is on Pacman's old spot
+    assert new_output_map[1][1] == "👻"  # Ghost is on Pacman's old spot
 
 
 def test_ghost_restores_pellet_after_moving():
     """Tests that the ghost leaves a pellet behind if it was on one."""
-    test_map = [
-        ['=', '=', '='],
-        ['=', '.', '='],
-        ['=', 'F', '='],  # Ghost at [2, 1]
-        ['=', '=', '=']
-    ]
-    # Base map for restoring the tile
-    base_map = [
+    test_map = Map([
         ['=', '=', '='],
         ['=', '.', '='],
         ['=', '.', '='],  # Ghost starts on a pellet at [2, 1]
         ['=', '=', '=']
-    ]
+    ])
+    output_map = test_map.get_display_map([0, 0], [[2, 1]])
 
-    ghost_pos = [2, 1]
-    g = Ghost(base_map, test_map, ghost_pos)
+    g = Ghost(test_map, [2, 1])
 
     # The only valid move is 'up'
-    new_output_map, new_ghost_pos, lose = g.move_ghost()
+    new_output_map, lose = g.move_ghost(output_map)
 
     assert lose is False
-    assert new_ghost_pos == [1, 1]
+    assert g.ghost_position == [1, 1]
     assert new_output_map[2][1] == "."  # Ghost's old spot is restored to a pellet
-    assert new_output_map[1][1] == "F"  # Ghost is on the new spot
\ No newline at end of file
+    assert new_output_map[1][1] == "👻"  # Ghost is on the new spot
+
+
+def test_ghost_moves_on_after_catching_pacman():
+    """Tests that a catch only affects the move that caused it."""
+    test_map = Map([
+        ['=', '=', '='],
+        ['=', ' ', '='],  # Pacman at [1, 1]
+        ['=', ' ', '='],  # Ghost at [2, 1]
+        ['=', '=', '=']
+    ])
+    output_map = test_map.get_display_map([1, 1], [[2, 1]])
+    g = Ghost(test_map, [2, 1])
+    _, lose = g.move_ghost(output_map)
+    assert lose is True
+
+    # With Pacman gone, the ghost's next move (back down) is no catch
+    output_map = test_map.get_display_map([0, 0], [[1, 1]])
+    _, lose = g.move_ghost(output_map)
+
+    assert lose is False
+    assert g.ghost_position == [2, 1]
@@ -0,0 +1,88 @@
+"""
+Pytest tests for terminal keyboard input.
+
+This file tests how raw terminal input is turned into Pacman moves:
+- Letter keys and arrow-key escape sequences
+- Keeping only the latest move key
+- Polling stdin with a timeout
+"""
+
+import os
+import sys
+
+import pytest
+
+from src.keyboard_input import KeyboardInput, parse_keys
+from src.map import UP, DOWN, LEFT, RIGHT
+
+
+def test_letter_and_arrow_keys_map_to_moves():
+    """Tests that WASD and the arrow-key sequences are recognised."""
+    assert parse_keys("w") == (UP, "")
+    assert parse_keys("A") == (LEFT, "")  # Caps lock doesn't matter
+    assert parse_keys("\x1b[B") == (DOWN, "")
+    assert parse_keys("\x1bOC") == (RIGHT, "")  # Application cursor mode
+
+
+def test_modified_arrow_keys_map_to_moves():
+    """Tests that arrow keys with modifier parameters aren't read as letter keys."""
+    assert parse_keys("\x1b[1;5A") == (UP, "")  # Ctrl+Up
+    assert parse_keys("\x1b[1;2D") == (LEFT, "")  # Shift+Left
+    assert parse_keys("\x1b[3~") == (None, "")  # Delete is not a move
+    assert parse_keys("\x1b\x1b[A") == (UP, "")  # Alt+Up on some terminals
+    assert parse_keys("\x1bd") == (RIGHT, "")  # Alt+D counts as D
+
+
+def test_latest_move_key_wins():
+    """Tests that when several keys are waiting, the latest move key is used."""
+    assert parse_keys("sd") == (RIGHT, "")
+    assert parse_keys("w\x1b[B") == (DOWN, "")
+    assert parse_keys("d\x1b[Dx") == (LEFT, "")  # Keys that aren't moves are ignored
+    assert parse_keys("xyz") == (None, "")
+
+
+def test_unfinished_sequence_is_kept():
+    """Tests that an escape sequence cut off at the end of a chunk is handed back."""
+    assert parse_keys("w\x1b") == (UP, "\x1b")
+    assert parse_keys("\x1b[") == (None, "\x1b[")
+    assert parse_keys("s\x1b[1;5") == (DOWN, "\x1b[1;5")
+    assert parse_keys("\x1b[1;5" + "C") == (RIGHT, "")
+
+
+def test_lone_escape_does_not_swallow_next_key():
+    """Tests that the key typed after a lone Esc press is still read."""
+    move, pending = parse_keys("\x1b")
+    assert (move, pending) == (None, "\x1b")
+
+    assert parse_keys(pending + "w") == (UP, "")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="stdin polling uses select() on POSIX")
+def test_poll_move_reads_stdin(monkeypatch):
+    """Tests that poll_move returns a waiting key and times out when there is none."""
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd) as stdin:
+        monkeypatch.setattr(sys, "stdin", stdin)
+        keyboard = KeyboardInput()
+
+        os.write(write_fd, b"\x1b[A")
+        assert keyboard.poll_move(timeout=1) == UP
+
+        assert keyboard.poll_move(timeout=0.01) is None
+    os.close(write_fd)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="stdin polling uses select() on POSIX")
+def test_poll_move_joins_sequence_split_across_reads(monkeypatch):
+    """Tests that an arrow key split over two reads isn't taken for letter keys."""
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd) as stdin:
+        monkeypatch.setattr(sys, "stdin", stdin)
+        keyboard = KeyboardInput()
+
+        os.write(write_fd, b"\x1b[")
+        assert keyboard.poll_move(timeout=0.01) is None
+
+        os.write(write_fd, b"D")
+        assert keyboard.poll_move(timeout=1) == LEFT
+    os.close(write_fd)